@@ -39,12 +39,17 @@ public static class Extensions
                     // Reduce retry attempts from default 4 to 2
                     MaxRetryAttempts = 2,
                     
-                    // Use exponential backoff
+                    // Use exponential backoff with jitter so clients that failed together
+                    // don't retry in lockstep, capped to keep tail latency bounded
                     Delay = TimeSpan.FromSeconds(1),
                     BackoffType = DelayBackoffType.Exponential,
+                    UseJitter = true,
+                    MaxDelay = TimeSpan.FromSeconds(30),
                     
-                    // Only retry on transient failures (5xx status codes and network failures)
+                    // Only retry on transient failures (5xx status codes, 429 and network failures);
+                    // a Retry-After header on the response overrides the backoff delay (ShouldRetryAfterHeader default)
                     ShouldHandle = static args => ValueTask.FromResult(args.Outcome.Result?.StatusCode is null or
+                        HttpStatusCode.TooManyRequests or
                         HttpStatusCode.InternalServerError or
                         HttpStatusCode.BadGateway or
                         HttpStatusCode.GatewayTimeout or
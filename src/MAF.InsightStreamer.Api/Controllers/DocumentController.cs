@@ -13,6 +13,9 @@ namespace MAF.InsightStreamer.Api.Controllers;
 [Route("api/[controller]")]
 public class DocumentController : ControllerBase
 {
+    private static readonly string[] AllowedExtensions = { ".pdf", ".docx", ".md", ".txt" };
+    private static readonly string[] SupportedTypes = { "pdf", "docx", "md", "txt" };
+
     private readonly IDocumentService _documentService;
     private readonly IQuestionAnswerService _questionAnswerService;
     private readonly ILogger<DocumentController> _logger;
@@ -75,13 +78,12 @@ public class DocumentController : ControllerBase
             }
 
             // Validate file extension
-            var allowedExtensions = new[] { ".pdf", ".docx", ".md", ".txt" };
             var fileExtension = Path.GetExtension(file.FileName)?.ToLowerInvariant();
             
-            if (string.IsNullOrEmpty(fileExtension) || !allowedExtensions.Contains(fileExtension))
+            if (string.IsNullOrEmpty(fileExtension) || !AllowedExtensions.Contains(fileExtension))
             {
                 _logger.LogWarning("Document analysis attempted with unsupported file type: {FileName}", file.FileName);
-                return BadRequest($"Unsupported file type '{fileExtension}'. Supported file types are: {string.Join(", ", allowedExtensions)}");
+                return BadRequest($"Unsupported file type '{fileExtension}'. Supported file types are: {string.Join(", ", AllowedExtensions)}");
             }
 
             // Process the document
@@ -120,8 +122,7 @@ public class DocumentController : ControllerBase
     [ProducesResponseType(typeof(string[]), StatusCodes.Status200OK)]
     public IActionResult GetSupportedTypes()
     {
-        var supportedTypes = new[] { "pdf", "docx", "md", "txt" };
-        return Ok(supportedTypes);
+        return Ok(SupportedTypes);
     }
 
     /// <summary>
@@ -40,14 +40,31 @@ if (app.Environment.IsDevelopment())
     app.MapOpenApi();
 }
 
-// Use CORS before other middleware
-app.UseCors("AllowAll");
-
 app.UseHttpsRedirection();
 
 // Enable static files serving - order matters!
-app.UseDefaultFiles();  // This should come before UseStaticFiles
-app.UseStaticFiles();
+app.UseDefaultFiles();  // Rewrites "/" to index.html, so it must run before routing matches endpoints
+app.UseRouting();
+
+// Use CORS after routing and before any endpoint runs
+app.UseCors("AllowAll");
+
+// Serves wwwroot with gzip/brotli variants compressed at build time, so requests never compress on the fly.
+// MapStaticAssets throws without the build's endpoints manifest (e.g. hosts that only copy the assembly),
+// so fall back to plain static files there.
+var staticAssetsManifest = Path.Combine(AppContext.BaseDirectory, $"{app.Environment.ApplicationName}.staticwebassets.endpoints.json");
+if (File.Exists(staticAssetsManifest))
+{
+    app.MapStaticAssets();
+}
+else
+{
+    // A publish that lost the manifest serves uncompressed, unfingerprinted files; make that visible
+    app.Logger.LogWarning(
+        "Static assets manifest {ManifestPath} not found; serving wwwroot without precompression or fingerprinted ETags",
+        staticAssetsManifest);
+    app.UseStaticFiles();
+}
 
 app.MapControllers();
 
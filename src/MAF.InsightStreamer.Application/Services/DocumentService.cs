@@ -22,6 +22,12 @@ public class DocumentService : IDocumentService
     private readonly ILogger<DocumentService> _logger;
     private readonly IMemoryCache _memoryCache;
 
+    // Reused across calls so System.Text.Json can cache its type metadata
+    private static readonly JsonSerializerOptions AnalysisResultJsonOptions = new()
+    {
+        PropertyNameCaseInsensitive = true
+    };
+
     /// <summary>
     /// Initializes a new instance of the DocumentService class.
     /// </summary>
@@ -317,12 +323,7 @@ public class DocumentService : IDocumentService
             // Clean up malformed JSON that starts with ""json or similar prefixes
             var cleanedResult = CleanJsonResponse(analysisResult);
             
-            var options = new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            };
-            
-            var jsonResponse = JsonSerializer.Deserialize<OrchestratorAnalysisResult>(cleanedResult, options);
+            var jsonResponse = JsonSerializer.Deserialize<OrchestratorAnalysisResult>(cleanedResult, AnalysisResultJsonOptions);
             
             if (jsonResponse == null)
             {
@@ -22,6 +22,10 @@ public class QuestionAnswerService : IQuestionAnswerService
     private readonly ILogger<QuestionAnswerService> _logger;
     private readonly QuestionAnswerSettings _settings;
 
+    private static readonly System.Text.RegularExpressions.Regex HtmlCommentPattern = new(
+        @"<!--.*?-->",
+        System.Text.RegularExpressions.RegexOptions.Singleline | System.Text.RegularExpressions.RegexOptions.Compiled);
+
     /// <summary>
     /// Initializes a new instance of the QuestionAnswerService class.
     /// </summary>
@@ -268,7 +272,7 @@ public class QuestionAnswerService : IQuestionAnswerService
     /// Cleans JSON response by removing markdown formatting, comments, and other non-JSON content.
     /// </summary>
     /// <param name="response">The raw response that may contain JSON.</param>
-    /// <returns>Cleaned JSON string or original response if no cleaning was possible.</returns>
+    /// <returns>Cleaned JSON string or original response if no cleaning was possible. The result is not validated; callers parse it.</returns>
     private string CleanJsonResponse(string response)
     {
         if (string.IsNullOrWhiteSpace(response))
@@ -288,11 +292,9 @@ public class QuestionAnswerService : IQuestionAnswerService
                 jsonContent = jsonContent.Replace("```json", "").Replace("```", "");
                 
                 // Remove HTML comments and other common formatting issues
-                jsonContent = System.Text.RegularExpressions.Regex.Replace(jsonContent, @"<!--.*?-->", "", System.Text.RegularExpressions.RegexOptions.Singleline);
+                jsonContent = HtmlCommentPattern.Replace(jsonContent, "");
                 
-                // Try to parse the cleaned content
-                JsonSerializer.Deserialize<JsonElement>(jsonContent);
-                _logger.LogDebug("Successfully cleaned JSON response");
+                _logger.LogDebug("Cleaned JSON response");
                 return jsonContent;
             }
             
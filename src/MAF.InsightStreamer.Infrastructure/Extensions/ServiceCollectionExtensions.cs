@@ -7,6 +7,7 @@ using MAF.InsightStreamer.Application.Interfaces;
 using MAF.InsightStreamer.Application.Services;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
+using YoutubeExplode;
 
 namespace MAF.InsightStreamer.Infrastructure.Extensions;
 
@@ -22,6 +23,7 @@ public static class ServiceCollectionExtensions
         // Register MCP services
         services.AddSingleton<McpGatewayHostedService>();
         services.AddHostedService(provider => provider.GetRequiredService<McpGatewayHostedService>());
+        services.AddSingleton<YouTubeRateLimiter>();
         services.AddSingleton<McpYouTubeService>();
         
         // Register document processing configuration
@@ -38,6 +40,15 @@ public static class ServiceCollectionExtensions
         // Register MCP service as Singleton (maintains connection)
         services.AddSingleton<McpYouTubeService>();
 
+        // YoutubeClient is built on a factory client so YouTube calls go through the shared
+        // resilience pipeline (429 and Retry-After handling). It is scoped so the factory can rotate
+        // handlers (and pick up DNS changes) while its pooled handlers still reuse connections.
+        // Retries happen inside a single YouTubeRateLimiter lease, so retried attempts are not
+        // charged against the token bucket; Retry-After spacing is what throttles them.
+        services.AddHttpClient(YouTubeService.HttpClientName);
+        services.AddScoped(provider => new YoutubeClient(
+            provider.GetRequiredService<IHttpClientFactory>().CreateClient(YouTubeService.HttpClientName)));
+
         // Register YouTubeService with proper lifetime
         services.AddScoped<IYouTubeService, YouTubeService>();
 
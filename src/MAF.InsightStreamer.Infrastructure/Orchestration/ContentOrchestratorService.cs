@@ -35,6 +35,10 @@ public class ContentOrchestratorService : IContentOrchestratorService
     // Thread cache at orchestrator level to keep threads warm during service lifetime
     private readonly ConcurrentDictionary<string, object> _activeThreads = new();
 
+    private static readonly System.Text.RegularExpressions.Regex HtmlCommentPattern = new(
+        @"<!--.*?-->",
+        System.Text.RegularExpressions.RegexOptions.Singleline | System.Text.RegularExpressions.RegexOptions.Compiled);
+
     public ContentOrchestratorService(
         IOptions<ProviderSettings> settings,
         IYouTubeService youtubeService,
@@ -114,9 +118,14 @@ public class ContentOrchestratorService : IContentOrchestratorService
 
         _logger.LogInformation("Cache MISS for video URL: {VideoUrl}. Fetching from YouTube service.", videoUrl);
 
-        // Fetch from YouTube service
-        var metadata = await _youtubeService.GetVideoMetadataAsync(videoUrl, cancellationToken);
-        var transcriptResult = await _youtubeService.GetTranscriptAsync(videoUrl, cancellationToken: cancellationToken);
+        // Fetch metadata and transcript concurrently - both are independent YouTube round trips.
+        // Metadata is awaited first so an invalid or unavailable video fails without waiting on the transcript;
+        // GetTranscriptAsync reports errors through its result, so the transcript task is never left faulted.
+        var metadataTask = _youtubeService.GetVideoMetadataAsync(videoUrl, cancellationToken);
+        var transcriptTask = _youtubeService.GetTranscriptAsync(videoUrl, cancellationToken: cancellationToken);
+
+        var metadata = await metadataTask;
+        var transcriptResult = await transcriptTask;
 
         if (!transcriptResult.Success)
         {
@@ -254,9 +263,12 @@ Provide the summary using this markdown formatting.";
         [Description("The conversation history for maintaining context")] string conversationHistory,
         CancellationToken cancellationToken = default)
     {
-        _logger.LogDebug(
-            "AnswerQuestionAboutDocument called with {Provider}:{Model} for question: {Question}",
-            _currentConfig.Provider, _currentConfig.Model, question.Length > 100 ? question.Substring(0, 100) + "..." : question);
+        if (_logger.IsEnabled(LogLevel.Debug))
+        {
+            _logger.LogDebug(
+                "AnswerQuestionAboutDocument called with {Provider}:{Model} for question: {Question}",
+                _currentConfig.Provider, _currentConfig.Model, question.Length > 100 ? question.Substring(0, 100) + "..." : question);
+        }
 
         try
         {
@@ -375,10 +387,10 @@ Example valid response:
             {
                 _logger.LogDebug("Attempting to parse AI response: {Response}", response);
                 
-                var jsonDoc = JsonDocument.Parse(response);
+                using var jsonDoc = JsonDocument.Parse(response);
                 
                 // Validate required properties exist
-                if (!jsonDoc.RootElement.TryGetProperty("answer", out var answerElement))
+                if (!jsonDoc.RootElement.TryGetProperty("answer", out _))
                 {
                     throw new JsonException("Missing required property 'answer' in JSON response");
                 }
@@ -388,20 +400,13 @@ Example valid response:
                     throw new JsonException("Missing required property 'relevantChunks' in JSON response");
                 }
 
-                var answer = answerElement.GetString() ?? string.Empty;
-                
-                var relevantChunks = new List<int>();
-                if (chunksElement.ValueKind == JsonValueKind.Array)
-                {
-                    relevantChunks = chunksElement
-                        .EnumerateArray()
-                        .Where(x => x.ValueKind == JsonValueKind.Number)
-                        .Select(x => x.GetInt32())
-                        .ToList();
-                }
+                // The caller parses the response itself, so only count the chunk indices here
+                var relevantChunkCount = chunksElement.ValueKind == JsonValueKind.Array
+                    ? chunksElement.EnumerateArray().Count(x => x.ValueKind == JsonValueKind.Number)
+                    : 0;
 
                 _logger.LogInformation("Successfully answered question for thread {ThreadId} using {ChunkCount} chunks with {Provider}:{Model}",
-                    threadId, relevantChunks.Count, _currentConfig.Provider, _currentConfig.Model);
+                    threadId, relevantChunkCount, _currentConfig.Provider, _currentConfig.Model);
 
                 return response;
             }
@@ -416,8 +421,12 @@ Example valid response:
                 {
                     try
                     {
-                        var jsonDoc = JsonDocument.Parse(cleanedResponse);
-                        var answer = jsonDoc.RootElement.GetProperty("answer").GetString() ?? cleanedResponse;
+                        using var jsonDoc = JsonDocument.Parse(cleanedResponse);
+                        if (!jsonDoc.RootElement.TryGetProperty("answer", out _))
+                        {
+                            throw new JsonException("Missing required property 'answer' in cleaned JSON response");
+                        }
+
                         _logger.LogInformation("Successfully parsed cleaned JSON response for thread {ThreadId} with {Provider}:{Model}",
                             threadId, _currentConfig.Provider, _currentConfig.Model);
                         return cleanedResponse;
@@ -524,7 +533,7 @@ Example valid response:
     /// Cleans JSON response by removing markdown formatting, comments, and other non-JSON content.
     /// </summary>
     /// <param name="response">The raw response that may contain JSON.</param>
-    /// <returns>Cleaned JSON string or original response if no cleaning was possible.</returns>
+    /// <returns>Cleaned JSON string or original response if no cleaning was possible. The result is not validated; callers parse it.</returns>
     private string CleanJsonResponse(string response)
     {
         if (string.IsNullOrWhiteSpace(response))
@@ -544,11 +553,9 @@ Example valid response:
                 jsonContent = jsonContent.Replace("```json", "").Replace("```", "");
                 
                 // Remove HTML comments and other common formatting issues
-                jsonContent = System.Text.RegularExpressions.Regex.Replace(jsonContent, @"<!--.*?-->", "", System.Text.RegularExpressions.RegexOptions.Singleline);
+                jsonContent = HtmlCommentPattern.Replace(jsonContent, "");
                 
-                // Try to parse the cleaned content
-                JsonDocument.Parse(jsonContent);
-                _logger.LogDebug("Successfully cleaned JSON response");
+                _logger.LogDebug("Cleaned JSON response");
                 return jsonContent;
             }
             
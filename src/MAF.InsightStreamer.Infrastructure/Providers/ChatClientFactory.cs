@@ -6,6 +6,7 @@ using MAF.InsightStreamer.Application.Configuration;
 using OpenAI;
 using OpenAI.Chat;
 using System.ClientModel;
+using System.Collections.Concurrent;
 
 namespace MAF.InsightStreamer.Infrastructure.Providers;
 
@@ -15,6 +16,11 @@ public class ChatClientFactory : IChatClientFactory
     private readonly IConfiguration _configuration;
     private readonly ILogger<ChatClientFactory> _logger;
 
+    // The orchestrator is scoped, so without this every request would build a fresh OpenAI client.
+    // One entry per provider: a different endpoint, model or key replaces it, so arbitrary model
+    // names sent to /api/model/switch cannot grow the cache.
+    private readonly ConcurrentDictionary<ModelProvider, CachedChatClient> _clients = new();
+
     public ChatClientFactory(
         IOptionsMonitor<ModelDiscoverySettings> discoverySettings,
         IConfiguration configuration,
@@ -26,6 +32,24 @@ public class ChatClientFactory : IChatClientFactory
     }
 
     public IChatClient CreateClient(ProviderConfiguration config)
+    {
+        // Clients are thread-safe and hold no per-request state, so the current one per provider is shared
+        if (_clients.TryGetValue(config.Provider, out var cached) && cached.Matches(config))
+        {
+            return cached.Client;
+        }
+
+        var client = BuildClient(config);
+        _clients[config.Provider] = new CachedChatClient(config.Endpoint, config.Model, config.ApiKey, client);
+        return client;
+    }
+
+    /// <summary>
+    /// Gets the number of cached chat clients.
+    /// </summary>
+    internal int CachedClientCount => _clients.Count;
+
+    private IChatClient BuildClient(ProviderConfiguration config)
     {
         return config.Provider switch
         {
@@ -64,4 +88,10 @@ public class ChatClientFactory : IChatClientFactory
 
         return chatClient.AsIChatClient();
     }
-}
\ No newline at end of file
+
+    private sealed record CachedChatClient(string Endpoint, string Model, string? ApiKey, IChatClient Client)
+    {
+        public bool Matches(ProviderConfiguration config) =>
+            Endpoint == config.Endpoint && Model == config.Model && ApiKey == config.ApiKey;
+    }
+}
@@ -157,8 +157,12 @@ public class ChunkingService : IChunkingService
 
             chunks.Add(chunk);
 
-            _logger.LogDebug("Created chunk {ChunkIndex} with length {ChunkLength} characters, start time: {StartTime}, end time: {EndTime}", 
-                chunk.ChunkIndex, chunk.Text.Length, chunk.StartTimeSeconds, chunk.EndTimeSeconds);
+            // Guarded so the boxed arguments are not allocated per chunk when debug logging is off
+            if (_logger.IsEnabled(LogLevel.Debug))
+            {
+                _logger.LogDebug("Created chunk {ChunkIndex} with length {ChunkLength} characters, start time: {StartTime}, end time: {EndTime}", 
+                    chunk.ChunkIndex, chunk.Text.Length, chunk.StartTimeSeconds, chunk.EndTimeSeconds);
+            }
 
             // Advance position by (chunkSize - overlapSize) for overlap
             position += (chunkSize - overlapSize);
@@ -260,8 +264,11 @@ public class ChunkingService : IChunkingService
 
             chunks.Add(chunk);
 
-            _logger.LogDebug("Created chunk {ChunkIndex} with length {ChunkLength} characters, start position: {StartPosition}, end position: {EndPosition}",
-                chunk.ChunkIndex, chunk.Content.Length, chunk.StartPosition, chunk.EndPosition);
+            if (_logger.IsEnabled(LogLevel.Debug))
+            {
+                _logger.LogDebug("Created chunk {ChunkIndex} with length {ChunkLength} characters, start position: {StartPosition}, end position: {EndPosition}",
+                    chunk.ChunkIndex, chunk.Content.Length, chunk.StartPosition, chunk.EndPosition);
+            }
 
             // Advance position by (chunkSize - overlapSize) for overlap
             position += (chunkSize - overlapSize);
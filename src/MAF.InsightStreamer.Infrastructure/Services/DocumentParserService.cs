@@ -5,6 +5,7 @@ using Microsoft.Extensions.Logging;
 using System.Text;
 using System.Threading;
 using UglyToad.PdfPig;
+using DocumentFormat.OpenXml;
 using DocumentFormat.OpenXml.Packaging;
 
 namespace MAF.InsightStreamer.Infrastructure.Services;
@@ -16,6 +17,9 @@ public class DocumentParserService : IDocumentParserService
 {
     private readonly ILogger<DocumentParserService> _logger;
 
+    // w:document (0) > w:body (1) > w:p (2)
+    private const int BodyParagraphDepth = 2;
+
     /// <summary>
     /// Initializes a new instance of the DocumentParserService class.
     /// </summary>
@@ -181,16 +185,29 @@ public class DocumentParserService : IDocumentParserService
         try
         {
             using var wordDocument = WordprocessingDocument.Open(stream, false);
-            var body = wordDocument.MainDocumentPart?.Document?.Body;
-            if (body == null)
+            var mainPart = wordDocument.MainDocumentPart;
+            if (mainPart == null)
             {
                 return Task.FromResult(string.Empty);
             }
 
+            // Stream the part with a SAX-style reader rather than loading the whole DOM,
+            // materializing only the top-level body paragraphs one at a time
             var text = new StringBuilder();
-            foreach (var element in body.Elements<DocumentFormat.OpenXml.Wordprocessing.Paragraph>())
+            using var reader = OpenXmlReader.Create(mainPart);
+            while (!reader.EOF)
             {
-                text.AppendLine(element.InnerText);
+                if (reader.IsStartElement
+                    && reader.Depth == BodyParagraphDepth
+                    && reader.ElementType == typeof(DocumentFormat.OpenXml.Wordprocessing.Paragraph))
+                {
+                    // LoadCurrentElement advances the reader past the paragraph
+                    text.AppendLine(reader.LoadCurrentElement()?.InnerText);
+                }
+                else
+                {
+                    reader.Read();
+                }
             }
 
             return Task.FromResult(text.ToString());
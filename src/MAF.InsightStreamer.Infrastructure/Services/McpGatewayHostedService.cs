@@ -103,6 +103,9 @@ public class McpGatewayHostedService : IHostedService, IDisposable
         var maxAttempts = 30; // 30 seconds max
         var attemptDelay = TimeSpan.FromSeconds(1);
 
+        // Reuse one client across attempts instead of opening a new connection pool per probe
+        using var httpClient = new HttpClient { Timeout = TimeSpan.FromSeconds(2) };
+
         for (int i = 0; i < maxAttempts; i++)
         {
             if (cancellationToken.IsCancellationRequested)
@@ -111,9 +114,10 @@ public class McpGatewayHostedService : IHostedService, IDisposable
             try
             {
                 // Try to connect to the gateway endpoint
-                using var httpClient = new HttpClient { Timeout = TimeSpan.FromSeconds(2) };
-                var response = await httpClient.GetAsync(
-                    $"http://localhost:{_gatewayPort}/health", 
+                // Headers are enough to tell the gateway is up; skip reading the body
+                using var response = await httpClient.GetAsync(
+                    $"http://localhost:{_gatewayPort}/health",
+                    HttpCompletionOption.ResponseHeadersRead,
                     cancellationToken
                 );
 
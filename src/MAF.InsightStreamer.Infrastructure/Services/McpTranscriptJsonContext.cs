@@ -0,0 +1,34 @@
+namespace MAF.InsightStreamer.Infrastructure.Services;
+
+using System.Text.Json.Serialization;
+
+/// <summary>
+/// Source-generated serializer metadata for the MCP transcript payload.
+/// Avoids reflection-based (de)serialization on the transcript hot path.
+/// </summary>
+[JsonSerializable(typeof(McpTranscriptResponse))]
+internal partial class McpTranscriptJsonContext : JsonSerializerContext
+{
+}
+
+// Helper classes for JSON deserialization (actual MCP response)
+internal class McpTranscriptResponse
+{
+    [JsonPropertyName("title")]
+    public string? Title { get; set; }
+
+    [JsonPropertyName("snippets")]
+    public List<SnippetItem>? Snippets { get; set; }
+}
+
+internal class SnippetItem
+{
+    [JsonPropertyName("text")]
+    public string? Text { get; set; }
+
+    [JsonPropertyName("start")]
+    public double? Start { get; set; }
+
+    [JsonPropertyName("duration")]
+    public double? Duration { get; set; }
+}
@@ -3,24 +3,56 @@ namespace MAF.InsightStreamer.Infrastructure.Services;
 using ModelContextProtocol;
 using ModelContextProtocol.Client;
 using MAF.InsightStreamer.Domain.Models;
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
+using System.Collections.Concurrent;
+using System.Diagnostics.CodeAnalysis;
 using System.Text.Json;
-using System.Text.Json.Serialization;
 
 public class McpYouTubeService : IDisposable
 {
     private readonly ILogger<McpYouTubeService> _logger;
     private readonly McpGatewayHostedService _gatewayService;
+    private readonly IMemoryCache _cache;
+    private readonly YouTubeRateLimiter _rateLimiter;
     private McpClient? _mcpClient;
     private readonly SemaphoreSlim _initLock = new(1, 1);
     private bool _isInitialized;
 
+    // Transcripts for a given video and language rarely change, so repeat lookups are served from memory
+    private const string TranscriptKeyPrefix = "transcript:";
+    private const string UnavailableTranscriptKeyPrefix = "transcript:neg:";
+    private static readonly TimeSpan TranscriptCacheExpiration = TimeSpan.FromHours(1);
+
+    // Kept short so a video that gains captions later is picked up again
+    private static readonly TimeSpan UnavailableTranscriptExpiration = TimeSpan.FromMinutes(10);
+
+    // Tool errors meaning YouTube has no transcript to give; throttling, IP blocks and transport failures are not cached
+    private static readonly string[] TranscriptUnavailableIndicators =
+    {
+        "TranscriptsDisabled",
+        "NoTranscriptFound",
+        "NoTranscriptAvailable",
+        "VideoUnavailable",
+        "Subtitles are disabled",
+        "No transcripts were found",
+        "No transcripts are available",
+        "no longer available"
+    };
+
+    // Concurrent requests for the same uncached transcript share a single upstream fetch
+    private readonly ConcurrentDictionary<string, Lazy<Task<List<TranscriptChunk>>>> _inflightTranscripts = new();
+
     public McpYouTubeService(
         ILogger<McpYouTubeService> logger,
-        McpGatewayHostedService gatewayService)
+        McpGatewayHostedService gatewayService,
+        IMemoryCache cache,
+        YouTubeRateLimiter rateLimiter)
     {
         _logger = logger;
         _gatewayService = gatewayService;
+        _cache = cache;
+        _rateLimiter = rateLimiter;
     }
 
     private async Task EnsureInitializedAsync(CancellationToken cancellationToken = default)
@@ -78,44 +110,49 @@ public class McpYouTubeService : IDisposable
         string language = "en",
         CancellationToken cancellationToken = default)
     {
-        try
+        var cacheKey = GetTranscriptCacheKey(videoId, language);
+        if (TryGetCachedTranscript(cacheKey, out var cachedChunks))
         {
-            await EnsureInitializedAsync(cancellationToken);
+            return cachedChunks;
+        }
 
-            if (_mcpClient == null)
-            {
-                _logger.LogError("MCP client is not initialized");
-                return new List<TranscriptChunk>();
-            }
+        var unavailableKey = GetUnavailableTranscriptCacheKey(videoId, language);
+        if (_cache.TryGetValue(unavailableKey, out string? unavailableReason))
+        {
+            _logger.LogDebug("Transcript previously unavailable for video: {VideoId} ({Language}): {Reason}", videoId, language, unavailableReason);
+            return new List<TranscriptChunk>();
+        }
 
-            var videoUrl = $"https://www.youtube.com/watch?v={videoId}";
-            _logger.LogInformation("Requesting transcript via MCP for video: {VideoId}", videoId);
+        var fetch = _inflightTranscripts.GetOrAdd(cacheKey, key => new Lazy<Task<List<TranscriptChunk>>>(
+            () => FetchTranscriptAsync(videoId, language, key, unavailableKey)));
 
-            // Call the get_timed_transcript tool (includes timestamps)
-            var toolArguments = new Dictionary<string, object?>
-            {
-                { "url", videoUrl },
-                { "lang", language }
-            };
+        try
+        {
+            // The shared fetch is not tied to any single caller's token; each caller only stops waiting
+            return await fetch.Value.WaitAsync(cancellationToken);
+        }
+        catch (OperationCanceledException)
+        {
+            _logger.LogWarning("Transcript request cancelled for video: {VideoId}", videoId);
+            return new List<TranscriptChunk>();
+        }
+    }
 
-            var toolResult = await _mcpClient.CallToolAsync(
-                "get_timed_transcript",
-                toolArguments,
-                cancellationToken: cancellationToken
-            );
+    private async Task<List<TranscriptChunk>> FetchTranscriptAsync(
+        string videoId,
+        string language,
+        string cacheKey,
+        string unavailableKey)
+    {
+        try
+        {
+            var chunks = await RequestTranscriptAsync(videoId, language, unavailableKey);
 
-            if (toolResult?.Content == null || !toolResult.Content.Any())
+            if (chunks.Count > 0)
             {
-                _logger.LogWarning("No transcript content returned from MCP for video: {VideoId}", videoId);
-                return new List<TranscriptChunk>();
+                _cache.Set(cacheKey, new CachedTranscript(chunks), TranscriptCacheExpiration);
             }
 
-            // Parse the result
-            var chunks = ParseMcpTranscriptResult((IReadOnlyList<ModelContextProtocol.Protocol.ContentBlock>)toolResult.Content);
-
-            _logger.LogInformation("Successfully retrieved {ChunkCount} transcript chunks via MCP for video: {VideoId}",
-                chunks.Count, videoId);
-
             return chunks;
         }
         catch (Exception ex)
@@ -123,6 +160,133 @@ public class McpYouTubeService : IDisposable
             _logger.LogError(ex, "Error getting transcript via MCP for video: {VideoId}", videoId);
             return new List<TranscriptChunk>();
         }
+        finally
+        {
+            _inflightTranscripts.TryRemove(cacheKey, out _);
+        }
+    }
+
+    /// <summary>
+    /// Calls the MCP transcript tool once and parses its result; unavailable transcripts are negative-cached here.
+    /// </summary>
+    /// <param name="videoId">The video to fetch the transcript for.</param>
+    /// <param name="language">The requested transcript language.</param>
+    /// <param name="unavailableKey">The negative-cache key for this video and language.</param>
+    /// <returns>The parsed transcript chunks, or an empty list when none are available.</returns>
+    internal virtual async Task<List<TranscriptChunk>> RequestTranscriptAsync(
+        string videoId,
+        string language,
+        string unavailableKey)
+    {
+        await EnsureInitializedAsync();
+
+        if (_mcpClient == null)
+        {
+            _logger.LogError("MCP client is not initialized");
+            return new List<TranscriptChunk>();
+        }
+
+        var videoUrl = $"https://www.youtube.com/watch?v={videoId}";
+        _logger.LogInformation("Requesting transcript via MCP for video: {VideoId}", videoId);
+
+        // Call the get_timed_transcript tool (includes timestamps)
+        var toolArguments = new Dictionary<string, object?>
+        {
+            { "url", videoUrl },
+            { "lang", language }
+        };
+
+        using var lease = await _rateLimiter.AcquireAsync();
+        var toolResult = await _mcpClient.CallToolAsync(
+            "get_timed_transcript",
+            toolArguments
+        );
+
+        if (toolResult?.IsError == true)
+        {
+            var errorText = toolResult.Content?.OfType<ModelContextProtocol.Protocol.TextContentBlock>().FirstOrDefault()?.Text;
+            RecordToolError(videoId, language, errorText);
+            return new List<TranscriptChunk>();
+        }
+
+        if (toolResult?.Content == null || !toolResult.Content.Any())
+        {
+            _logger.LogWarning("No transcript content returned from MCP for video: {VideoId}", videoId);
+            _cache.Set(unavailableKey, "No transcript content", UnavailableTranscriptExpiration);
+            return new List<TranscriptChunk>();
+        }
+
+        // Parse the result
+        var chunks = ParseMcpTranscriptResult((IReadOnlyList<ModelContextProtocol.Protocol.ContentBlock>)toolResult.Content);
+
+        _logger.LogInformation("Successfully retrieved {ChunkCount} transcript chunks via MCP for video: {VideoId}",
+            chunks.Count, videoId);
+
+        return chunks;
+    }
+
+    /// <summary>
+    /// Gets the number of transcript fetches currently in flight.
+    /// </summary>
+    internal int InflightTranscriptCount => _inflightTranscripts.Count;
+
+    private static string GetTranscriptCacheKey(string videoId, string language)
+    {
+        return $"{TranscriptKeyPrefix}{videoId}:{language}";
+    }
+
+    private static string GetUnavailableTranscriptCacheKey(string videoId, string language)
+    {
+        return $"{UnavailableTranscriptKeyPrefix}{videoId}:{language}";
+    }
+
+    /// <summary>
+    /// Logs a transcript tool error and negative-caches it only when it says the transcript does not exist.
+    /// </summary>
+    /// <param name="videoId">The video the transcript was requested for.</param>
+    /// <param name="language">The requested transcript language.</param>
+    /// <param name="errorText">The error text reported by the tool, if any.</param>
+    internal void RecordToolError(string videoId, string language, string? errorText)
+    {
+        if (!IsTranscriptUnavailableError(errorText))
+        {
+            _logger.LogWarning("MCP transcript request failed for video: {VideoId}: {Error}", videoId, errorText);
+            return;
+        }
+
+        _logger.LogWarning("MCP reported transcript unavailable for video: {VideoId}: {Error}", videoId, errorText);
+        _cache.Set(GetUnavailableTranscriptCacheKey(videoId, language), errorText, UnavailableTranscriptExpiration);
+    }
+
+    private static bool IsTranscriptUnavailableError([NotNullWhen(true)] string? errorText)
+    {
+        if (string.IsNullOrEmpty(errorText))
+            return false;
+
+        foreach (var indicator in TranscriptUnavailableIndicators)
+        {
+            if (errorText.Contains(indicator, StringComparison.OrdinalIgnoreCase))
+                return true;
+        }
+
+        return false;
+    }
+
+    /// <summary>
+    /// Looks up a cached transcript and records the hit on the same entry, so a cache hit costs a single lookup.
+    /// </summary>
+    private bool TryGetCachedTranscript(string cacheKey, [NotNullWhen(true)] out List<TranscriptChunk>? chunks)
+    {
+        if (_cache.TryGetValue(cacheKey, out CachedTranscript? cached) && cached != null)
+        {
+            var hits = cached.Increment();
+            _logger.LogDebug("Transcript cache HIT for {CacheKey}, hit count: {Hits}", cacheKey, hits);
+            chunks = cached.Chunks;
+            return true;
+        }
+
+        chunks = null;
+        return false;
     }
 
     private List<TranscriptChunk> ParseMcpTranscriptResult(IReadOnlyList<ModelContextProtocol.Protocol.ContentBlock> content)
@@ -139,7 +303,7 @@ public class McpYouTubeService : IDisposable
                     if (string.IsNullOrWhiteSpace(text)) continue;
 
                     // Parse the actual MCP response format
-                    var response = JsonSerializer.Deserialize<McpTranscriptResponse>(text);
+                    var response = JsonSerializer.Deserialize(text, McpTranscriptJsonContext.Default.McpTranscriptResponse);
                     if (response?.Snippets != null)
                     {
                         int index = 0;
@@ -165,30 +329,34 @@ public class McpYouTubeService : IDisposable
 
         return chunks;
     }
-public void Dispose()
-{
-    _initLock?.Dispose();
-}
 
-// Helper classes for JSON deserialization (actual MCP response)
-private class McpTranscriptResponse
-{
-    [JsonPropertyName("title")]
-    public string? Title { get; set; }
-    
-    [JsonPropertyName("snippets")]
-    public List<SnippetItem>? Snippets { get; set; }
-}
+    public void Dispose()
+    {
+        _initLock?.Dispose();
+    }
 
-private class SnippetItem
-{
-    [JsonPropertyName("text")]
-    public string? Text { get; set; }
-    
-    [JsonPropertyName("start")]
-    public double? Start { get; set; }
-    
-    [JsonPropertyName("duration")]
-    public double? Duration { get; set; }
-}
+    /// <summary>
+    /// Cached transcript together with its re-use counter.
+    /// </summary>
+    internal class CachedTranscript
+    {
+        private long _hits;
+
+        public CachedTranscript(List<TranscriptChunk> chunks)
+        {
+            Chunks = chunks;
+        }
+
+        public List<TranscriptChunk> Chunks { get; }
+
+        public long Hits => Interlocked.Read(ref _hits);
+
+        /// <summary>
+        /// Records a cache hit and returns the updated count.
+        /// </summary>
+        public long Increment()
+        {
+            return Interlocked.Increment(ref _hits);
+        }
+    }
 }
@@ -54,7 +54,9 @@ public class ModelDiscoveryService : IModelDiscoveryService
         try
         {
             var client = _httpClientFactory.CreateClient();
-            var response = await client.GetAsync(endpoint, ct);
+
+            // Only the status code matters, so don't buffer the response body
+            using var response = await client.GetAsync(endpoint, HttpCompletionOption.ResponseHeadersRead, ct);
             return response.IsSuccessStatusCode;
         }
         catch
@@ -67,8 +69,8 @@ public class ModelDiscoveryService : IModelDiscoveryService
     {
         // GET http://localhost:11434/api/tags
         var client = _httpClientFactory.CreateClient();
-        var response = await client.GetAsync(
-            $"{_settings.Value.OllamaEndpoint}/api/tags", ct);
+        using var response = await client.GetAsync(
+            $"{_settings.Value.OllamaEndpoint}/api/tags", HttpCompletionOption.ResponseHeadersRead, ct);
         
         response.EnsureSuccessStatusCode();
         
@@ -88,8 +90,8 @@ public class ModelDiscoveryService : IModelDiscoveryService
     {
         // GET http://localhost:1234/v1/models
         var client = _httpClientFactory.CreateClient();
-        var response = await client.GetAsync(
-            $"{_settings.Value.LMStudioEndpoint}/v1/models", ct);
+        using var response = await client.GetAsync(
+            $"{_settings.Value.LMStudioEndpoint}/v1/models", HttpCompletionOption.ResponseHeadersRead, ct);
         
         response.EnsureSuccessStatusCode();
         
@@ -0,0 +1,65 @@
+namespace MAF.InsightStreamer.Infrastructure.Services;
+
+using System.Threading.RateLimiting;
+
+/// <summary>
+/// Process-wide token bucket shared by every component that calls YouTube.
+/// Concurrent requests wait in a bounded queue instead of collectively exceeding YouTube's quota and triggering 429 responses.
+/// </summary>
+public class YouTubeRateLimiter : IDisposable
+{
+    private const int TokenLimit = 10;
+    private const int TokensPerPeriod = 5;
+    private const int QueueLimit = 100;
+    private static readonly TimeSpan ReplenishmentPeriod = TimeSpan.FromSeconds(1);
+
+    private readonly TokenBucketRateLimiter _limiter;
+
+    /// <summary>
+    /// Initializes a new instance of the YouTubeRateLimiter class with the production bucket settings.
+    /// </summary>
+    public YouTubeRateLimiter()
+        : this(new TokenBucketRateLimiterOptions
+        {
+            TokenLimit = TokenLimit,
+            TokensPerPeriod = TokensPerPeriod,
+            ReplenishmentPeriod = ReplenishmentPeriod,
+            QueueLimit = QueueLimit,
+            QueueProcessingOrder = QueueProcessingOrder.OldestFirst,
+            AutoReplenishment = true
+        })
+    {
+    }
+
+    /// <summary>
+    /// Initializes a new instance of the YouTubeRateLimiter class with custom bucket settings.
+    /// </summary>
+    /// <param name="options">The token bucket options.</param>
+    internal YouTubeRateLimiter(TokenBucketRateLimiterOptions options)
+    {
+        _limiter = new TokenBucketRateLimiter(options);
+    }
+
+    /// <summary>
+    /// Waits for a token before a YouTube request is issued.
+    /// </summary>
+    /// <param name="cancellationToken">The cancellation token to abort waiting.</param>
+    /// <returns>The acquired lease, which should be disposed once the request completes.</returns>
+    /// <exception cref="InvalidOperationException">Thrown when the wait queue is full.</exception>
+    public async Task<RateLimitLease> AcquireAsync(CancellationToken cancellationToken = default)
+    {
+        var lease = await _limiter.AcquireAsync(1, cancellationToken);
+        if (!lease.IsAcquired)
+        {
+            lease.Dispose();
+            throw new InvalidOperationException("Too many pending YouTube requests, please try again later");
+        }
+
+        return lease;
+    }
+
+    public void Dispose()
+    {
+        _limiter.Dispose();
+    }
+}
@@ -9,6 +9,7 @@ using Google.Apis.YouTube.v3;
 using MAF.InsightStreamer.Application.Interfaces;
 using MAF.InsightStreamer.Domain.Models;
 using MAF.InsightStreamer.Infrastructure.Providers;
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
 using System;
@@ -26,11 +27,41 @@ using YoutubeExplode.Exceptions;
 /// </summary>
 public class YouTubeService : IYouTubeService
 {
+    /// <summary>
+    /// Name of the IHttpClientFactory client the YoutubeClient is built on.
+    /// </summary>
+    public const string HttpClientName = "youtube";
+
+    // Compiled once; matching is linear in the URL length as none of the patterns backtrack
+    private static readonly Regex[] VideoUrlPatterns =
+    {
+        new(@"youtube\.com/watch\?(?:[^&#]*&)*v=([a-zA-Z0-9_-]{11})", RegexOptions.Compiled | RegexOptions.CultureInvariant),
+        new(@"youtu\.be/([a-zA-Z0-9_-]{11})", RegexOptions.Compiled | RegexOptions.CultureInvariant),
+        new(@"youtube\.com/(?:embed|shorts|live)/([a-zA-Z0-9_-]{11})", RegexOptions.Compiled | RegexOptions.CultureInvariant)
+    };
+
+    private static readonly Regex VideoIdPattern = new(@"^[a-zA-Z0-9_-]{11}$", RegexOptions.Compiled | RegexOptions.CultureInvariant);
+
+    // Message fragments YoutubeExplode uses when a video does not exist
+    private static readonly string[] NotFoundIndicators = { "not found", "404" };
+
+    // Unavailable-video messages that mean the video is really gone; YoutubeExplode raises the same
+    // exception for bot checks and other throttling, which must not be negative-cached
+    private static readonly string[] VideoGoneIndicators = { "private", "removed", "does not exist", "no longer available", "terminated", "deleted" };
+
     private readonly YoutubeClient _youtubeClient;
     private readonly Google.Apis.YouTube.v3.YouTubeService _youtubeDataApi;
     private readonly ILogger<YouTubeService> _logger;
     private readonly string _youTubeApiKey;
     private readonly McpYouTubeService _mcpService;
+    private readonly IMemoryCache _cache;
+    private readonly YouTubeRateLimiter _rateLimiter;
+    private const string MetadataKeyPrefix = "video:metadata:";
+    private const string UnavailableVideoKeyPrefix = "video:neg:";
+
+    // Title, author and duration rarely change once a video is published
+    private static readonly TimeSpan MetadataCacheExpiration = TimeSpan.FromHours(6);
+    private static readonly TimeSpan UnavailableVideoExpiration = TimeSpan.FromMinutes(10);
 
     /// <summary>
     /// Initializes a new instance of the YouTubeService class.
@@ -38,11 +69,16 @@ public class YouTubeService : IYouTubeService
     /// <param name="logger">The logger instance for recording service operations.</param>
     /// <param name="providerSettings">The provider settings containing YouTube API key and transcript service URL.</param>
     /// <param name="mcpService">The MCP YouTube service for transcript extraction.</param>
-    public YouTubeService(ILogger<YouTubeService> logger, IOptions<ProviderSettings> providerSettings, McpYouTubeService mcpService)
+    /// <param name="cache">The memory cache for remembering unavailable videos.</param>
+    /// <param name="rateLimiter">The shared rate limiter applied to outgoing YouTube requests.</param>
+    /// <param name="youtubeClient">The YoutubeClient used for metadata lookups.</param>
+    public YouTubeService(ILogger<YouTubeService> logger, IOptions<ProviderSettings> providerSettings, McpYouTubeService mcpService, IMemoryCache cache, YouTubeRateLimiter rateLimiter, YoutubeClient youtubeClient)
     {
-        _youtubeClient = new YoutubeClient();
+        _youtubeClient = youtubeClient ?? throw new ArgumentNullException(nameof(youtubeClient));
         _logger = logger ?? throw new ArgumentNullException(nameof(logger));
         _mcpService = mcpService ?? throw new ArgumentNullException(nameof(mcpService));
+        _cache = cache ?? throw new ArgumentNullException(nameof(cache));
+        _rateLimiter = rateLimiter ?? throw new ArgumentNullException(nameof(rateLimiter));
 
         // Initialize YouTube Data API for metadata operations
         if (providerSettings?.Value == null)
@@ -79,11 +115,40 @@ public class YouTubeService : IYouTubeService
             throw new ArgumentException("Video URL cannot be null or empty", nameof(videoUrl));
         }
 
+        // Reject malformed input before it touches the cache or consumes a rate limiter token
+        var videoId = ExtractVideoIdFromUrl(videoUrl);
+        if (videoId == null)
+        {
+            _logger.LogWarning("Invalid video URL format: {VideoUrl}", videoUrl);
+            throw new ArgumentException($"Invalid video URL format: {videoUrl}", nameof(videoUrl));
+        }
+
+        var metadataKey = $"{MetadataKeyPrefix}{videoId}";
+        if (_cache.TryGetValue(metadataKey, out VideoMetadata? cachedMetadata) && cachedMetadata != null)
+        {
+            _logger.LogDebug("Metadata cache HIT for video: {VideoId}", cachedMetadata.VideoId);
+            return cachedMetadata;
+        }
+
+        // Short-circuit videos that recently failed as unavailable or not found
+        var unavailableKey = $"{UnavailableVideoKeyPrefix}{videoId}";
+        if (_cache.TryGetValue(unavailableKey, out bool isNotFound))
+        {
+            _logger.LogWarning("Video previously reported unavailable, skipping lookup: {VideoUrl}", videoUrl);
+            if (isNotFound)
+            {
+                throw new ArgumentException($"Video not found: {videoUrl}", nameof(videoUrl));
+            }
+
+            throw new VideoUnavailableException($"Video is unavailable or restricted: {videoUrl}");
+        }
+
         try
         {
             _logger.LogInformation("Extracting metadata for video URL: {VideoUrl}", videoUrl);
 
-            var video = await _youtubeClient.Videos.GetAsync(videoUrl, cancellationToken);
+            using var lease = await _rateLimiter.AcquireAsync(cancellationToken);
+            var video = await _youtubeClient.Videos.GetAsync(videoId, cancellationToken);
 
             var metadata = new VideoMetadata
             {
@@ -95,16 +160,19 @@ public class YouTubeService : IYouTubeService
             };
 
             _logger.LogInformation("Successfully extracted metadata for video: {VideoId} - {Title}", metadata.VideoId, metadata.Title);
+            _cache.Set(metadataKey, metadata, MetadataCacheExpiration);
             return metadata;
         }
         catch (VideoUnavailableException ex)
         {
             _logger.LogError(ex, "Video is unavailable or restricted: {VideoUrl}", videoUrl);
+            RecordUnavailableVideo(videoId, ex);
             throw new VideoUnavailableException($"Video is unavailable or restricted: {videoUrl}");
         }
-        catch (YoutubeExplodeException ex) when (ex.Message.Contains("not found") || ex.Message.Contains("404"))
+        catch (YoutubeExplodeException ex) when (IsNotFoundError(ex))
         {
             _logger.LogError(ex, "Video not found: {VideoUrl}", videoUrl);
+            _cache.Set(unavailableKey, true, UnavailableVideoExpiration);
             throw new ArgumentException($"Video not found: {videoUrl}", nameof(videoUrl), ex);
         }
         catch (ArgumentException ex)
@@ -164,6 +232,44 @@ public class YouTubeService : IYouTubeService
         }
     }
 
+    /// <summary>
+    /// Determines whether a YoutubeExplode failure indicates that the video does not exist.
+    /// </summary>
+    /// <param name="exception">The exception raised by YoutubeExplode.</param>
+    /// <returns>True if the exception message reports a missing video, false otherwise.</returns>
+    private static bool IsNotFoundError(YoutubeExplodeException exception)
+    {
+        return MessageContainsAny(exception, NotFoundIndicators);
+    }
+
+    /// <summary>
+    /// Negative-caches an unavailable video only when the failure says the video is gone rather than throttled.
+    /// </summary>
+    /// <param name="videoId">The ID of the video that failed.</param>
+    /// <param name="exception">The unavailable-video exception raised by YoutubeExplode.</param>
+    internal void RecordUnavailableVideo(string videoId, VideoUnavailableException exception)
+    {
+        if (!MessageContainsAny(exception, VideoGoneIndicators))
+        {
+            _logger.LogWarning("Not caching unavailable result for video {VideoId}, it may be transient: {Reason}", videoId, exception.Message);
+            return;
+        }
+
+        _cache.Set($"{UnavailableVideoKeyPrefix}{videoId}", false, UnavailableVideoExpiration);
+    }
+
+    private static bool MessageContainsAny(Exception exception, string[] indicators)
+    {
+        var message = exception.Message;
+        foreach (var indicator in indicators)
+        {
+            if (message.Contains(indicator, StringComparison.OrdinalIgnoreCase))
+                return true;
+        }
+
+        return false;
+    }
+
     /// <summary>
     /// Extracts video ID from YouTube URL.
     /// </summary>
@@ -175,22 +281,15 @@ public class YouTubeService : IYouTubeService
             return null;
 
         // Handle various YouTube URL formats
-        var patterns = new[]
-        {
-            @"youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-            @"youtu\.be/([a-zA-Z0-9_-]{11})",
-            @"youtube\.com/embed/([a-zA-Z0-9_-]{11})"
-        };
-
-        foreach (var pattern in patterns)
+        foreach (var pattern in VideoUrlPatterns)
         {
-            var match = Regex.Match(videoUrl, pattern);
+            var match = pattern.Match(videoUrl);
             if (match.Success)
                 return match.Groups[1].Value;
         }
 
         // If it's already a video ID (11 characters)
-        if (Regex.IsMatch(videoUrl, @"^[a-zA-Z0-9_-]{11}$"))
+        if (VideoIdPattern.IsMatch(videoUrl))
             return videoUrl;
 
         return null;
@@ -47,6 +47,54 @@ namespace MAF.InsightStreamer.Infrastructure.Tests.Services
             Assert.NotNull(result);
         }
 
+        [Fact]
+        public void CreateClient_ReturnsSameClient_ForSameConfiguration()
+        {
+            // Arrange
+            var config = new ProviderConfiguration
+            {
+                Provider = ModelProvider.Ollama,
+                ApiKey = null,
+                Endpoint = "http://localhost:11434/v1",
+                Model = "llama3.2"
+            };
+            var otherModelConfig = new ProviderConfiguration
+            {
+                Provider = ModelProvider.Ollama,
+                ApiKey = null,
+                Endpoint = "http://localhost:11434/v1",
+                Model = "mistral:latest"
+            };
+
+            // Act
+            var first = _chatClientFactory.CreateClient(config);
+            var second = _chatClientFactory.CreateClient(config);
+            var otherModel = _chatClientFactory.CreateClient(otherModelConfig);
+
+            // Assert
+            Assert.Same(first, second);
+            Assert.NotSame(first, otherModel);
+        }
+
+        [Fact]
+        public void CreateClient_SwitchingThroughManyModels_KeepsOneClientPerProvider()
+        {
+            // Act
+            for (var i = 0; i < 50; i++)
+            {
+                _chatClientFactory.CreateClient(new ProviderConfiguration
+                {
+                    Provider = ModelProvider.Ollama,
+                    ApiKey = null,
+                    Endpoint = "http://localhost:11434/v1",
+                    Model = $"model-{i}"
+                });
+            }
+
+            // Assert
+            Assert.Equal(1, _chatClientFactory.CachedClientCount);
+        }
+
         [Fact]
         public void CreateClient_ThrowsInvalidOperationException_WhenOpenRouterHasNoApiKey()
         {
@@ -2,8 +2,12 @@ using MAF.InsightStreamer.Application.Interfaces;
 using MAF.InsightStreamer.Domain.Enums;
 using MAF.InsightStreamer.Domain.Models;
 using MAF.InsightStreamer.Infrastructure.Services;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using Word = DocumentFormat.OpenXml.Wordprocessing;
 using Microsoft.Extensions.Logging;
 using Moq;
+using System;
 using System.IO;
 using System.Text;
 using System.Threading.Tasks;
@@ -163,6 +167,31 @@ Used for testing plain text extraction functionality.";
         Assert.Contains("Stream must be seekable", exception.InnerException?.Message);
     }
 
+    [Fact]
+    public async Task ExtractFromWordAsync_WithValidDocument_ReturnsBodyParagraphsInOrder()
+    {
+        // Arrange
+        using var stream = new MemoryStream();
+        using (var wordDocument = WordprocessingDocument.Create(stream, WordprocessingDocumentType.Document))
+        {
+            var mainPart = wordDocument.AddMainDocumentPart();
+            mainPart.Document = new Word.Document(new Word.Body(
+                new Word.Paragraph(new Word.Run(new Word.Text("First paragraph"))),
+                new Word.Paragraph(new Word.Run(new Word.Text("Second paragraph"))),
+                new Word.Table(new Word.TableRow(new Word.TableCell(
+                    new Word.Paragraph(new Word.Run(new Word.Text("Table cell text")))))),
+                new Word.Paragraph(new Word.Run(new Word.Text("Third paragraph")))));
+        }
+        stream.Position = 0;
+
+        // Act
+        var result = await _service.ExtractTextAsync(stream, DocumentType.Word);
+
+        // Assert
+        var lines = result.Split(Environment.NewLine, StringSplitOptions.RemoveEmptyEntries);
+        Assert.Equal(new[] { "First paragraph", "Second paragraph", "Third paragraph" }, lines);
+    }
+
     [Fact]
     public async Task ExtractFromPdfAsync_WithNonSeekableStream_ThrowsDocumentParsingException()
     {
@@ -0,0 +1,184 @@
+using MAF.InsightStreamer.Domain.Models;
+using MAF.InsightStreamer.Infrastructure.Services;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Logging;
+using Moq;
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using Xunit;
+
+namespace MAF.InsightStreamer.Infrastructure.Tests.Services;
+
+public class McpYouTubeServiceTests : IDisposable
+{
+    private const string VideoId = "dQw4w9WgXcQ";
+
+    private readonly MemoryCache _cache;
+    private readonly YouTubeRateLimiter _rateLimiter = new();
+    private readonly McpYouTubeService _service;
+
+    public McpYouTubeServiceTests()
+    {
+        _cache = new MemoryCache(new MemoryCacheOptions());
+
+        // The gateway is never started, so any call that reaches MCP fails fast
+        var gatewayService = new McpGatewayHostedService(new Mock<ILogger<McpGatewayHostedService>>().Object);
+        _service = new McpYouTubeService(new Mock<ILogger<McpYouTubeService>>().Object, gatewayService, _cache, _rateLimiter);
+    }
+
+    public void Dispose()
+    {
+        _rateLimiter.Dispose();
+        _cache.Dispose();
+    }
+
+    [Fact]
+    public async Task GetTranscriptAsync_CachedTranscript_ReturnsCachedChunksWithoutCallingGateway()
+    {
+        // Arrange
+        var cachedChunks = new List<TranscriptChunk>
+        {
+            new() { ChunkIndex = 0, Text = "Cached segment", StartTimeSeconds = 0, EndTimeSeconds = 5 }
+        };
+        _cache.Set($"transcript:{VideoId}:en", new McpYouTubeService.CachedTranscript(cachedChunks));
+
+        // Act
+        var result = await _service.GetTranscriptAsync(VideoId, "en");
+
+        // Assert
+        Assert.Same(cachedChunks, result);
+    }
+
+    [Fact]
+    public async Task GetTranscriptAsync_CachedTranscript_TracksHitsOnCacheEntry()
+    {
+        // Arrange
+        var cachedTranscript = new McpYouTubeService.CachedTranscript(new List<TranscriptChunk>
+        {
+            new() { ChunkIndex = 0, Text = "Cached segment", StartTimeSeconds = 0, EndTimeSeconds = 5 }
+        });
+        _cache.Set($"transcript:{VideoId}:en", cachedTranscript);
+
+        // Act
+        await _service.GetTranscriptAsync(VideoId, "en");
+        await _service.GetTranscriptAsync(VideoId, "en");
+
+        // Assert
+        Assert.Equal(2, cachedTranscript.Hits);
+    }
+
+    [Fact]
+    public async Task GetTranscriptAsync_CachedTranscriptForOtherLanguage_IsNotReturned()
+    {
+        // Arrange
+        var cachedChunks = new List<TranscriptChunk>
+        {
+            new() { ChunkIndex = 0, Text = "Segment en español", StartTimeSeconds = 0, EndTimeSeconds = 5 }
+        };
+        _cache.Set($"transcript:{VideoId}:es", new McpYouTubeService.CachedTranscript(cachedChunks));
+
+        // Negative-cache the requested language so the lookup completes without starting a fetch
+        _cache.Set($"transcript:neg:{VideoId}:en", "No transcript content");
+
+        // Act
+        var result = await _service.GetTranscriptAsync(VideoId, "en");
+
+        // Assert
+        Assert.NotSame(cachedChunks, result);
+        Assert.Empty(result);
+    }
+
+    [Fact]
+    public async Task GetTranscriptAsync_ConcurrentRequestsForSameTranscript_ShareOneFetch()
+    {
+        // Arrange
+        using var service = CreateControlledService();
+        var fetchedChunks = new List<TranscriptChunk>
+        {
+            new() { ChunkIndex = 0, Text = "Fetched segment", StartTimeSeconds = 0, EndTimeSeconds = 5 }
+        };
+
+        // Act
+        var first = service.GetTranscriptAsync(VideoId, "en");
+        var second = service.GetTranscriptAsync(VideoId, "en");
+        service.Upstream.SetResult(fetchedChunks);
+        var results = await Task.WhenAll(first, second);
+
+        // Assert
+        Assert.Equal(1, service.RequestCount);
+        Assert.Same(fetchedChunks, results[0]);
+        Assert.Same(results[0], results[1]);
+    }
+
+    [Fact]
+    public async Task GetTranscriptAsync_FetchCompleted_RemovesInflightEntry()
+    {
+        // Arrange
+        using var service = CreateControlledService();
+
+        // Act
+        var pending = service.GetTranscriptAsync(VideoId, "en");
+        var inflightWhilePending = service.InflightTranscriptCount;
+        service.Upstream.SetResult(new List<TranscriptChunk>());
+        await pending;
+
+        // Assert
+        Assert.Equal(1, inflightWhilePending);
+        Assert.Equal(0, service.InflightTranscriptCount);
+    }
+
+    [Fact]
+    public void RecordToolError_TranscriptDisabled_IsNegativeCached()
+    {
+        // Act
+        _service.RecordToolError(VideoId, "en", "TranscriptsDisabled: Subtitles are disabled for this video");
+
+        // Assert
+        Assert.True(_cache.TryGetValue($"transcript:neg:{VideoId}:en", out _));
+    }
+
+    [Fact]
+    public void RecordToolError_ThrottledRequest_IsNotNegativeCached()
+    {
+        // Act
+        _service.RecordToolError(VideoId, "en", "429 Client Error: Too Many Requests for url: https://www.youtube.com/api/timedtext");
+
+        // Assert
+        Assert.False(_cache.TryGetValue($"transcript:neg:{VideoId}:en", out _));
+    }
+
+    private ControlledMcpYouTubeService CreateControlledService()
+    {
+        var gatewayService = new McpGatewayHostedService(new Mock<ILogger<McpGatewayHostedService>>().Object);
+        return new ControlledMcpYouTubeService(new Mock<ILogger<McpYouTubeService>>().Object, gatewayService, _cache, _rateLimiter);
+    }
+
+    /// <summary>
+    /// Replaces the MCP round trip with a task the test completes, counting how often it is requested.
+    /// </summary>
+    private sealed class ControlledMcpYouTubeService : McpYouTubeService
+    {
+        private int _requestCount;
+
+        public ControlledMcpYouTubeService(
+            ILogger<McpYouTubeService> logger,
+            McpGatewayHostedService gatewayService,
+            IMemoryCache cache,
+            YouTubeRateLimiter rateLimiter)
+            : base(logger, gatewayService, cache, rateLimiter)
+        {
+        }
+
+        public TaskCompletionSource<List<TranscriptChunk>> Upstream { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        public int RequestCount => Volatile.Read(ref _requestCount);
+
+        internal override Task<List<TranscriptChunk>> RequestTranscriptAsync(string videoId, string language, string unavailableKey)
+        {
+            Interlocked.Increment(ref _requestCount);
+            return Upstream.Task;
+        }
+    }
+}
@@ -0,0 +1,52 @@
+using MAF.InsightStreamer.Infrastructure.Services;
+using System;
+using System.Threading;
+using System.Threading.RateLimiting;
+using System.Threading.Tasks;
+using Xunit;
+
+namespace MAF.InsightStreamer.Infrastructure.Tests.Services;
+
+public class YouTubeRateLimiterTests
+{
+    [Fact]
+    public async Task AcquireAsync_TokensAvailable_ReturnsAcquiredLease()
+    {
+        // Arrange
+        using var rateLimiter = new YouTubeRateLimiter();
+
+        // Act
+        using var lease = await rateLimiter.AcquireAsync();
+
+        // Assert
+        Assert.True(lease.IsAcquired);
+    }
+
+    [Fact]
+    public async Task AcquireAsync_QueuedWaiterCancelled_ThrowsOperationCanceledException()
+    {
+        // Arrange
+        // No auto-replenishment, so a timer tick cannot refill the bucket mid-test
+        using var rateLimiter = new YouTubeRateLimiter(new TokenBucketRateLimiterOptions
+        {
+            TokenLimit = 1,
+            TokensPerPeriod = 1,
+            ReplenishmentPeriod = TimeSpan.FromSeconds(1),
+            QueueLimit = 1,
+            AutoReplenishment = false
+        });
+
+        // Drain the bucket; leases are not returned to a token bucket on dispose
+        (await rateLimiter.AcquireAsync()).Dispose();
+
+        using var cts = new CancellationTokenSource();
+        var waiter = rateLimiter.AcquireAsync(cts.Token);
+        Assert.False(waiter.IsCompleted);
+
+        // Act
+        cts.Cancel();
+
+        // Assert
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(() => waiter);
+    }
+}
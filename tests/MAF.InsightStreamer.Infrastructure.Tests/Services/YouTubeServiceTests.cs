@@ -3,6 +3,7 @@ using Google.Apis.YouTube.v3.Data;
 using MAF.InsightStreamer.Domain.Models;
 using MAF.InsightStreamer.Infrastructure.Providers;
 using MAF.InsightStreamer.Infrastructure.Services;
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
 using Moq;
@@ -14,15 +15,18 @@ using System.Net.Http;
 using System.Threading;
 using System.Threading.Tasks;
 using Xunit;
+using YoutubeExplode;
 using InfraYouTubeService = MAF.InsightStreamer.Infrastructure.Services.YouTubeService;
 
 namespace MAF.InsightStreamer.Infrastructure.Tests.Services;
 
-public class YouTubeServiceTests
+public class YouTubeServiceTests : IDisposable
 {
+    private readonly YouTubeRateLimiter _rateLimiter = new();
     private readonly Mock<ILogger<InfraYouTubeService>> _mockLogger;
     private readonly Mock<IOptions<ProviderSettings>> _mockProviderSettings;
     private readonly Mock<McpYouTubeService> _mockMcpYouTubeService;
+    private readonly IMemoryCache _cache;
     private readonly InfraYouTubeService _service;
 
     public YouTubeServiceTests()
@@ -42,8 +46,9 @@ public class YouTubeServiceTests
         _mockProviderSettings.Setup(x => x.Value).Returns(providerSettings);
         
         // Setup McpYouTubeService mock
-        _mockMcpYouTubeService = new Mock<McpYouTubeService>(_mockLogger.Object);
-        _service = new InfraYouTubeService(_mockLogger.Object, _mockProviderSettings.Object, _mockMcpYouTubeService.Object);
+        _cache = new MemoryCache(new MemoryCacheOptions());
+        _mockMcpYouTubeService = CreateMockMcpYouTubeService(_cache);
+        _service = new InfraYouTubeService(_mockLogger.Object, _mockProviderSettings.Object, _mockMcpYouTubeService.Object, _cache, _rateLimiter, new YoutubeClient());
     }
 
     [Fact]
@@ -124,10 +129,10 @@ public class YouTubeServiceTests
         };
         mockProviderSettings.Setup(x => x.Value).Returns(providerSettings);
         
-        var mockMcpYouTubeService = new Mock<McpYouTubeService>(new Mock<ILogger<McpYouTubeService>>().Object);
+        var mockMcpYouTubeService = CreateMockMcpYouTubeService(_cache);
 
         // Act
-        var service = new InfraYouTubeService(logger, mockProviderSettings.Object, mockMcpYouTubeService.Object);
+        var service = new InfraYouTubeService(logger, mockProviderSettings.Object, mockMcpYouTubeService.Object, _cache, _rateLimiter, new YoutubeClient());
 
         // Assert
         Assert.NotNull(service);
@@ -147,10 +152,10 @@ public class YouTubeServiceTests
         };
         mockProviderSettings.Setup(x => x.Value).Returns(providerSettings);
         
-        var mockMcpYouTubeService = new Mock<McpYouTubeService>(new Mock<ILogger<McpYouTubeService>>().Object);
+        var mockMcpYouTubeService = CreateMockMcpYouTubeService(_cache);
 
         // Act & Assert
-        Assert.Throws<ArgumentNullException>(() => new InfraYouTubeService(null!, mockProviderSettings.Object, mockMcpYouTubeService.Object));
+        Assert.Throws<ArgumentNullException>(() => new InfraYouTubeService(null!, mockProviderSettings.Object, mockMcpYouTubeService.Object, _cache, _rateLimiter, new YoutubeClient()));
     }
 
     [Fact]
@@ -158,10 +163,10 @@ public class YouTubeServiceTests
     {
         // Arrange
         var logger = new Mock<ILogger<InfraYouTubeService>>().Object;
-        var mockMcpYouTubeService = new Mock<McpYouTubeService>(new Mock<ILogger<McpYouTubeService>>().Object);
+        var mockMcpYouTubeService = CreateMockMcpYouTubeService(_cache);
 
         // Act & Assert
-        Assert.Throws<ArgumentNullException>(() => new InfraYouTubeService(logger, null!, mockMcpYouTubeService.Object));
+        Assert.Throws<ArgumentNullException>(() => new InfraYouTubeService(logger, null!, mockMcpYouTubeService.Object, _cache, _rateLimiter, new YoutubeClient()));
     }
 
     [Fact]
@@ -179,10 +184,10 @@ public class YouTubeServiceTests
         };
         mockProviderSettings.Setup(x => x.Value).Returns(providerSettings);
         
-        var mockMcpYouTubeService = new Mock<McpYouTubeService>(new Mock<ILogger<McpYouTubeService>>().Object);
+        var mockMcpYouTubeService = CreateMockMcpYouTubeService(_cache);
 
         // Act & Assert
-        Assert.Throws<ArgumentException>(() => new InfraYouTubeService(logger, mockProviderSettings.Object, mockMcpYouTubeService.Object));
+        Assert.Throws<ArgumentException>(() => new InfraYouTubeService(logger, mockProviderSettings.Object, mockMcpYouTubeService.Object, _cache, _rateLimiter, new YoutubeClient()));
     }
 
     [Fact]
@@ -244,6 +249,81 @@ public class YouTubeServiceTests
         Assert.Contains("Video is unavailable or restricted", exception.Message);
     }
 
+    [Fact]
+    public async Task GetVideoMetadataAsync_MalformedVideoUrl_ThrowsArgumentException()
+    {
+        // Arrange
+        const string malformedUrl = "https://example.com/watch?v=not-a-video";
+
+        // Act & Assert
+        var exception = await Assert.ThrowsAsync<ArgumentException>(() =>
+            _service.GetVideoMetadataAsync(malformedUrl));
+
+        Assert.Contains("Invalid video URL format", exception.Message);
+    }
+
+    [Fact]
+    public async Task GetVideoMetadataAsync_CachedMetadata_ReturnsCachedValue()
+    {
+        // Arrange
+        const string videoUrl = "https://youtu.be/dQw4w9WgXcQ";
+        var cachedMetadata = new VideoMetadata
+        {
+            VideoId = "dQw4w9WgXcQ",
+            Title = "Cached title",
+            Author = "Cached author",
+            Duration = TimeSpan.FromMinutes(3)
+        };
+        _cache.Set("video:metadata:dQw4w9WgXcQ", cachedMetadata);
+
+        // Act
+        var result = await _service.GetVideoMetadataAsync(videoUrl);
+
+        // Assert
+        Assert.Same(cachedMetadata, result);
+    }
+
+    [Fact]
+    public async Task GetVideoMetadataAsync_RecentlyUnavailableVideo_ThrowsWithoutLookup()
+    {
+        // Arrange
+        const string videoUrl = "https://www.youtube.com/watch?v=dQw4w9WgXcQ";
+        _cache.Set("video:neg:dQw4w9WgXcQ", false);
+
+        // Act & Assert
+        var exception = await Assert.ThrowsAsync<YoutubeExplode.Exceptions.VideoUnavailableException>(() =>
+            _service.GetVideoMetadataAsync(videoUrl));
+
+        Assert.Contains("Video is unavailable or restricted", exception.Message);
+    }
+
+    [Fact]
+    public void RecordUnavailableVideo_BotCheck_IsNotNegativeCached()
+    {
+        // Arrange
+        var exception = new YoutubeExplode.Exceptions.VideoUnavailableException("Sign in to confirm you're not a bot");
+
+        // Act
+        _service.RecordUnavailableVideo("dQw4w9WgXcQ", exception);
+
+        // Assert
+        Assert.False(_cache.TryGetValue("video:neg:dQw4w9WgXcQ", out _));
+    }
+
+    [Fact]
+    public void RecordUnavailableVideo_PrivateVideo_IsNegativeCached()
+    {
+        // Arrange
+        var exception = new YoutubeExplode.Exceptions.VideoUnavailableException("Video 'dQw4w9WgXcQ' is private.");
+
+        // Act
+        _service.RecordUnavailableVideo("dQw4w9WgXcQ", exception);
+
+        // Assert
+        Assert.True(_cache.TryGetValue("video:neg:dQw4w9WgXcQ", out bool isNotFound));
+        Assert.False(isNotFound);
+    }
+
     [Fact]
     public async Task GetTranscriptAsync_ValidVideoIdWithoutCaptions_ReturnsUnsuccessfulResult()
     {
@@ -280,4 +360,15 @@ public class YouTubeServiceTests
         Assert.Empty(result.Chunks); // Expected behavior when API calls fail
     }
 
-}
\ No newline at end of file
+    public void Dispose()
+    {
+        _rateLimiter.Dispose();
+        _cache.Dispose();
+    }
+
+    private Mock<McpYouTubeService> CreateMockMcpYouTubeService(IMemoryCache cache)
+    {
+        var gatewayService = new McpGatewayHostedService(new Mock<ILogger<McpGatewayHostedService>>().Object);
+        return new Mock<McpYouTubeService>(new Mock<ILogger<McpYouTubeService>>().Object, gatewayService, cache, _rateLimiter);
+    }
+}